@@ -4,9 +4,14 @@ echo "Running MattasMCP Test Suite"
 echo "============================="
 echo ""
 
-# Run tests with coverage
+# Run tests with coverage (requires pytest-cov and pytest-xdist).
+# If pytest-randomly is installed, test order is shuffled on each run to catch
+# state leaking through the session-scoped Todoist fixtures.
 python -m pytest tests/ \
+    -n auto \
+    --dist=loadscope \
     --tb=short \
+    --durations=10 \
     --cov=services \
     --cov=helpers \
     --cov-report=term-missing \
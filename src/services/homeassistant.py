@@ -4,6 +4,7 @@ import os
 import logging
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from .cache import cache_aside, CacheConfig, CacheTTL
 
 try:
@@ -15,7 +16,14 @@ except ImportError:
     except ImportError:
         websocket = None
         logging.warning("websocket-client not available - WebSocket features disabled")
+try:
+    import orjson
+except ImportError:
+    # Optional faster JSON decoder - fall back to requests/stdlib json
+    orjson = None
 import ssl
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timezone, timedelta
 from enum import Enum
@@ -28,6 +36,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Distinct hosts the adapter keeps a pool for (requests' default); unrelated
+# to POOL_MAXSIZE, which sizes each of those pools
+POOL_CONNECTIONS = 10
+# Max pooled connections per host; also bounds concurrent batch service calls
+POOL_MAXSIZE = 10
+
 
 class ConnectionType(Enum):
     """Connection type to Home Assistant"""
@@ -72,9 +86,21 @@ class Domain(Enum):
     NOTIFY = "notify"
 
 
+@functools.lru_cache(maxsize=128)
+def _classify_url(url: str) -> ConnectionType:
+    """Classify a Home Assistant URL as local or Nabu Casa (memoized per URL)"""
+    netloc = urlparse(url).netloc
+    if "ui.nabu.casa" in netloc or "remote.nabucasa.com" in netloc:
+        return ConnectionType.NABU_CASA
+    return ConnectionType.LOCAL
+
+
 class HomeAssistantService:
     """Synchronous service for interacting with Home Assistant via REST API"""
 
+    # Entity fields kept by get_entities(minimal=True), in output order
+    _MINIMAL_ENTITY_FIELDS = ("entity_id", "name", "domain", "area_id", "device_class")
+
     def __init__(self, url: str, access_token: str, verify_ssl: bool = True):
         """
         Initialize Home Assistant service
@@ -93,14 +119,59 @@ class HomeAssistantService:
             "Content-Type": "application/json",
         }
         self.timeout = 30  # seconds
+
+        # REST endpoints are invariant per instance, so build them once
+        self._api_root = self.url + "/api"
+        self._states_url = self._api_root + "/states"
+        self._services_url = self._api_root + "/services"
+        self._services_url_prefix = self._services_url + "/"
+
         self.areas_cache: Optional[List[Dict]] = None
         self.devices_cache: Optional[List[Dict]] = None
         self.entities_cache: Optional[Dict[str, Dict]] = None
+        self.areas_cache_by_id: Dict[str, Dict] = {}
+
+        # Persistent session so repeated calls reuse pooled keep-alive connections
+        # instead of paying a new TCP/TLS handshake per request
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # verify stays per request: a session-level value is overridden by
+        # REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE, which would silently re-enable it
+        self._req_kwargs = {"timeout": self.timeout, "verify": self.verify_ssl}
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
         logger.info(
             f"Initialized Home Assistant service ({self.connection_type.value}): {self.url}"
         )
 
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        self._session.close()
+
+    def _json(self, response: requests.Response) -> Any:
+        """Decode a JSON response body, using orjson when it is installed"""
+        content = response.content
+        if orjson is not None and isinstance(content, (bytes, bytearray)):
+            return orjson.loads(content)
+        return response.json()
+
+    def clear_cache(self) -> None:
+        """Drop cached areas, devices and entities so the next call refetches"""
+        self.areas_cache = None
+        self.devices_cache = None
+        self.entities_cache = None
+        self.areas_cache_by_id = {}
+
+    def __enter__(self) -> "HomeAssistantService":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     # ========== VALIDATION HELPERS ==========
 
     def _validate_entity_id(self, entity_id: Union[str, List[str]]) -> None:
@@ -145,22 +216,36 @@ class HomeAssistantService:
                 "  • Use `get_ha_all_entities` to see entities grouped by domain"
             )
 
-    def _validate_service(self, domain: str, service: str) -> None:
-        """Validate service exists for domain"""
-        try:
-            services = self.get_services()
-            if domain in services:
-                if service not in services[domain]["services"]:
-                    available = list(services[domain]["services"].keys())
-                    raise ValueError(
-                        f"Invalid service '{service}' for domain '{domain}'.\n"
-                        f"Available services: {', '.join(available[:10])}\n"
-                        "To see all services:\n"
-                        f"  • Use `get_ha_services` to list services for {domain} domain"
-                    )
-        except Exception as e:
-            # If we can't validate, log warning but don't block
-            logger.warning(f"Could not validate service {domain}.{service}: {e}")
+    def _validate_service(
+        self, domain: str, service: str, services: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Validate service exists for domain
+
+        Args:
+            domain: Service domain
+            service: Service name
+            services: Already fetched service registry; fetched when omitted
+        """
+        if services is None:
+            try:
+                services = self.get_services()
+            except Exception as e:
+                # If we can't validate, log warning but don't block
+                logger.warning(f"Could not validate service {domain}.{service}: {e}")
+                return
+
+        domain_info = services.get(domain) if isinstance(services, dict) else None
+        if not isinstance(domain_info, dict) or "services" not in domain_info:
+            # Unknown domain or unexpected registry shape: nothing to check against
+            return
+        if service not in domain_info["services"]:
+            available = list(domain_info["services"].keys())
+            raise ValueError(
+                f"Invalid service '{service}' for domain '{domain}'.\n"
+                f"Available services: {', '.join(available[:10])}\n"
+                "To see all services:\n"
+                f"  • Use `get_ha_services` to list services for {domain} domain"
+            )
 
     def _validate_brightness(self, brightness: Optional[int]) -> Optional[int]:
         """Validate brightness value and return as integer"""
@@ -250,22 +335,14 @@ class HomeAssistantService:
 
     def _detect_connection_type(self) -> ConnectionType:
         """Detect if this is a local or Nabu Casa connection"""
-        parsed = urlparse(self.url)
-        if "ui.nabu.casa" in parsed.netloc or "remote.nabucasa.com" in parsed.netloc:
-            return ConnectionType.NABU_CASA
-        return ConnectionType.LOCAL
+        return _classify_url(self.url)
 
     def test_connection(self) -> Dict[str, Any]:
         """Test connection to Home Assistant"""
         try:
-            response = requests.get(
-                f"{self.url}/api/",
-                headers=self.headers,
-                verify=self.verify_ssl,
-                timeout=self.timeout,
-            )
+            response = self._session.get(self._api_root + "/", **self._req_kwargs)
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 return {
                     "status": "success",
                     "message": data.get("message", "API running."),
@@ -289,14 +366,10 @@ class HomeAssistantService:
 
     def get_config(self) -> Dict[str, Any]:
         """Get Home Assistant configuration"""
-        response = requests.get(
-            f"{self.url}/api/config",
-            headers=self.headers,
-            verify=self.verify_ssl,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        return response.json()
+        response = self._session.get(self._api_root + "/config", **self._req_kwargs)
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return self._json(response)
 
     def get_states(
         self,
@@ -320,14 +393,10 @@ class HomeAssistantService:
             List of entity states
         """
         try:
-            response = requests.get(
-                f"{self.url}/api/states",
-                headers=self.headers,
-                verify=self.verify_ssl,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            states = response.json()
+            response = self._session.get(self._states_url, **self._req_kwargs)
+            if response.status_code >= 400:
+                response.raise_for_status()
+            states = self._json(response)
         except Exception as e:
             logger.error(f"Failed to get states: {e}")
             raise ValueError(
@@ -421,6 +490,16 @@ class HomeAssistantService:
         self._validate_domain(domain)
         self._validate_service(domain, service)
 
+        return self._post_service(domain, service, entity_id, service_data)
+
+    def _post_service(
+        self,
+        domain: str,
+        service: str,
+        entity_id: Optional[Union[str, List[str]]],
+        service_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """POST an already validated service call and map the response"""
         data = service_data.copy()
 
         if entity_id:
@@ -430,12 +509,10 @@ class HomeAssistantService:
                 data["entity_id"] = entity_id
 
         try:
-            response = requests.post(
-                f"{self.url}/api/services/{domain}/{service}",
-                headers=self.headers,
+            response = self._session.post(
+                self._services_url_prefix + domain + "/" + service,
                 json=data,
-                verify=self.verify_ssl,
-                timeout=self.timeout,
+                **self._req_kwargs,
             )
 
             if response.status_code == 200:
@@ -502,6 +579,61 @@ class HomeAssistantService:
                 "  • Check Home Assistant logs for more details"
             )
 
+    def call_services_batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Call several Home Assistant services concurrently
+
+        Args:
+            calls: List of dicts with 'domain', 'service' and optional
+                'entity_id' and 'data' (extra service data)
+
+        Returns:
+            One result per call, in the same order as ``calls``. Failed calls
+            return an error dict instead of raising.
+        """
+
+        if not calls:
+            return []
+
+        # Fetch the service registry once for the whole batch and validate each
+        # distinct domain/service pair against it, so workers only POST
+        try:
+            services = self.get_services()
+        except Exception as e:
+            logger.warning(f"Could not fetch services to validate batch: {e}")
+            services = {}
+
+        invalid: Dict[tuple, Exception] = {}
+        for pair in {(call.get("domain"), call.get("service")) for call in calls}:
+            try:
+                self._validate_domain(pair[0])
+                self._validate_service(pair[0], pair[1], services)
+            except Exception as e:
+                invalid[pair] = e
+
+        def _run(call: Dict[str, Any]) -> Dict[str, Any]:
+            domain, service = call.get("domain"), call.get("service")
+            try:
+                if (domain, service) in invalid:
+                    raise invalid[(domain, service)]
+                entity_id = call.get("entity_id")
+                if entity_id:
+                    self._validate_entity_id(entity_id)
+                return self._post_service(
+                    domain, service, entity_id, call.get("data") or {}
+                )
+            except Exception as e:
+                return {
+                    "status": "error",
+                    "error": str(e),
+                    "domain": domain,
+                    "service": service,
+                }
+
+        # Threads share the pooled session, so fan-out is capped at the pool size
+        with ThreadPoolExecutor(max_workers=min(len(calls), POOL_MAXSIZE)) as pool:
+            return list(pool.map(_run, calls))
+
     def turn_on(self, entity_id: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
         """Turn on an entity"""
         # Validate entity_id first
@@ -611,56 +743,25 @@ class HomeAssistantService:
             minimal: If True, return only essential fields to reduce token usage
         """
         if self.areas_cache is not None:
-            if minimal:
-                # Return minimal area data for LLM consumption
-                return [
-                    {
-                        "id": a.get("area_id"),
-                        "name": a.get("name"),
-                        "floor": a.get("floor_id"),
-                    }
-                    for a in self.areas_cache
-                ]
-            return self.areas_cache
+            return self._areas_result(minimal)
 
         try:
             # Try REST API first for backward compatibility
-            response = requests.get(
-                f"{self.url}/api/config/area_registry/list",
-                headers=self.headers,
-                verify=self.verify_ssl,
-                timeout=self.timeout,
+            response = self._session.get(
+                self._api_root + "/config/area_registry/list", **self._req_kwargs
             )
 
             if response.status_code == 200:
-                self.areas_cache = response.json()
-                if minimal:
-                    return [
-                        {
-                            "id": a.get("area_id"),
-                            "name": a.get("name"),
-                            "floor": a.get("floor_id"),
-                        }
-                        for a in self.areas_cache
-                    ]
-                return self.areas_cache
+                self._cache_areas(self._json(response))
+                return self._areas_result(minimal)
 
             # REST API not available, use WebSocket
             logger.info("REST API for areas not available, using WebSocket API")
             areas = self._get_areas_via_websocket()
 
             if areas is not None:
-                self.areas_cache = areas
-                if minimal:
-                    return [
-                        {
-                            "id": a.get("area_id"),
-                            "name": a.get("name"),
-                            "floor": a.get("floor_id"),
-                        }
-                        for a in self.areas_cache
-                    ]
-                return self.areas_cache
+                self._cache_areas(areas)
+                return self._areas_result(minimal)
             else:
                 # WebSocket also failed, return helpful message
                 logger.info("Could not retrieve areas via WebSocket")
@@ -683,19 +784,35 @@ class HomeAssistantService:
             # Try WebSocket as fallback
             areas = self._get_areas_via_websocket()
             if areas is not None:
-                self.areas_cache = areas
-                if minimal:
-                    return [
-                        {
-                            "id": a.get("area_id"),
-                            "name": a.get("name"),
-                            "floor": a.get("floor_id"),
-                        }
-                        for a in self.areas_cache
-                    ]
-                return self.areas_cache
+                self._cache_areas(areas)
+                return self._areas_result(minimal)
             return []
 
+    def get_area(self, area_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single area by ID from the id-keyed area cache"""
+        if self.areas_cache is None:
+            self.get_areas()
+        return self.areas_cache_by_id.get(area_id)
+
+    def _cache_areas(self, areas: List[Dict[str, Any]]) -> None:
+        """Cache the full area list along with an index keyed by area_id"""
+        self.areas_cache = areas
+        self.areas_cache_by_id = {a.get("area_id"): a for a in areas}
+
+    def _areas_result(self, minimal: bool) -> List[Dict[str, Any]]:
+        """Return cached areas, optionally projected to the minimal shape"""
+        if not minimal:
+            return self.areas_cache
+        # Return minimal area data for LLM consumption
+        return [
+            {
+                "id": a.get("area_id"),
+                "name": a.get("name"),
+                "floor": a.get("floor_id"),
+            }
+            for a in self.areas_cache
+        ]
+
     def _get_areas_via_websocket(self) -> Optional[List[Dict[str, Any]]]:
         """Get areas via WebSocket API when REST is not available"""
         if websocket is None:
@@ -802,14 +919,12 @@ class HomeAssistantService:
 
         try:
             # Try the device registry endpoint first
-            response = requests.get(
-                f"{self.url}/api/config/device_registry/list",
-                headers=self.headers,
-                verify=self.verify_ssl,
-                timeout=self.timeout,
+            response = self._session.get(
+                self._api_root + "/config/device_registry/list", **self._req_kwargs
             )
-            response.raise_for_status()
-            self.devices_cache = response.json()
+            if response.status_code >= 400:
+                response.raise_for_status()
+            self.devices_cache = self._json(response)
             devices = self.devices_cache
 
             # Apply pagination
@@ -914,18 +1029,7 @@ class HomeAssistantService:
 
             if minimal:
                 # Return only essential fields for LLM consumption
-                return [
-                    {
-                        "entity_id": e["entity_id"],
-                        "name": e["name"],
-                        "domain": e["domain"],
-                        "area_id": e.get("area_id"),
-                        "device_class": e.get(
-                            "device_class"
-                        ),  # Keep device_class as it's useful for understanding entity type
-                    }
-                    for e in entities
-                ]
+                return self._minimal_entities(entities)
             return entities
 
         # Get all states first
@@ -964,29 +1068,21 @@ class HomeAssistantService:
             entities = entities[offset:]
 
         if minimal:
-            return [
-                {
-                    "entity_id": e["entity_id"],
-                    "name": e["name"],
-                    "domain": e["domain"],
-                    "area_id": e.get("area_id"),
-                    "device_class": e.get("device_class"),
-                }
-                for e in entities
-            ]
+            return self._minimal_entities(entities)
 
         return entities
 
+    def _minimal_entities(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Project entity metadata down to _MINIMAL_ENTITY_FIELDS"""
+        fields = self._MINIMAL_ENTITY_FIELDS
+        return [{k: e.get(k) for k in fields} for e in entities]
+
     def get_services(self) -> Dict[str, Any]:
         """Get all available services"""
-        response = requests.get(
-            f"{self.url}/api/services",
-            headers=self.headers,
-            verify=self.verify_ssl,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        return response.json()
+        response = self._session.get(self._services_url, **self._req_kwargs)
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return self._json(response)
 
     def get_history(
         self,
@@ -1007,7 +1103,8 @@ class HomeAssistantService:
             offset: Number of results to skip (for pagination)
 
         Returns:
-            List of historical states
+            List of historical states, each with a ``last_changed_ts`` epoch
+            alongside the ISO ``last_changed`` string
         """
         if not start_time:
             start_time = datetime.now(timezone.utc) - timedelta(days=1)
@@ -1020,19 +1117,18 @@ class HomeAssistantService:
             "no_attributes": "false",
         }
 
-        url = f"{self.url}/api/history/period/{start_time.isoformat()}"
+        url = self._api_root + "/history/period/" + start_time.isoformat()
         if end_time:
             params["end_time"] = end_time.isoformat()
 
-        response = requests.get(
+        response = self._session.get(
             url,
-            headers=self.headers,
             params=params,
-            verify=self.verify_ssl,
-            timeout=self.timeout,
+            **self._req_kwargs,
         )
-        response.raise_for_status()
-        history = response.json()
+        if response.status_code >= 400:
+            response.raise_for_status()
+        history = self._json(response)
 
         # History API returns a list of lists, we want the first one for single entity
         result = history[0] if history else []
@@ -1044,6 +1140,21 @@ class HomeAssistantService:
         elif offset > 0:
             result = result[offset:]
 
+        # Expose last_changed as epoch seconds so callers can compare numerically
+        for record in result:
+            last_changed = record.get("last_changed")
+            if not last_changed:
+                continue
+            try:
+                changed = datetime.fromisoformat(last_changed)
+            except ValueError:
+                logger.debug("Unparseable last_changed in history: %r", last_changed)
+                continue
+            if changed.tzinfo is None:
+                # Home Assistant reports UTC; don't let naive values go local
+                changed = changed.replace(tzinfo=timezone.utc)
+            record["last_changed_ts"] = changed.timestamp()
+
         return result
 
     def get_logbook(
@@ -1074,17 +1185,16 @@ class HomeAssistantService:
         if end_time:
             params["end_time"] = end_time.isoformat()
 
-        url = f"{self.url}/api/logbook/{start_time.isoformat()}"
+        url = self._api_root + "/logbook/" + start_time.isoformat()
 
-        response = requests.get(
+        response = self._session.get(
             url,
-            headers=self.headers,
             params=params,
-            verify=self.verify_ssl,
-            timeout=self.timeout,
+            **self._req_kwargs,
         )
-        response.raise_for_status()
-        return response.json()
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return self._json(response)
 
     def fire_event(
         self, event_type: str, event_data: Optional[Dict[str, Any]] = None
@@ -1099,12 +1209,10 @@ class HomeAssistantService:
         Returns:
             Result of event firing
         """
-        response = requests.post(
-            f"{self.url}/api/events/{event_type}",
-            headers=self.headers,
+        response = self._session.post(
+            self._api_root + "/events/" + event_type,
             json=event_data or {},
-            verify=self.verify_ssl,
-            timeout=self.timeout,
+            **self._req_kwargs,
         )
 
         if response.status_code == 200:
@@ -1134,15 +1242,14 @@ class HomeAssistantService:
         if attributes:
             data["attributes"] = attributes
 
-        response = requests.post(
-            f"{self.url}/api/states/{entity_id}",
-            headers=self.headers,
+        response = self._session.post(
+            self._states_url + "/" + entity_id,
             json=data,
-            verify=self.verify_ssl,
-            timeout=self.timeout,
+            **self._req_kwargs,
         )
-        response.raise_for_status()
-        return response.json()
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return self._json(response)
 
 
 class HomeAssistantClient:
@@ -1180,6 +1287,10 @@ class HomeAssistantClient:
         if self.mcp:
             self._register_mcp_tools()
 
+    def close(self) -> None:
+        """Close the underlying service HTTP session"""
+        self.service.close()
+
     def test_connection(self) -> Dict[str, Any]:
         """Test connection to Home Assistant"""
         return self.service.test_connection()
@@ -1214,6 +1325,10 @@ class HomeAssistantClient:
         """Call Home Assistant service"""
         return self.service.call_service(domain, service, entity_id, **service_data)
 
+    def call_services_batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Call several Home Assistant services concurrently"""
+        return self.service.call_services_batch(calls)
+
     def turn_on(self, entity_id: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
         """Turn on an entity"""
         return self.service.turn_on(entity_id, **kwargs)
@@ -3611,10 +3726,9 @@ All sensors of the specified type with current values
                 if entity.get("entity_id") == entity_id:
                     area_id = entity.get("area_id")
                     if area_id:
-                        areas = self.get_areas()
-                        for area in areas:
-                            if area.get("area_id") == area_id:
-                                return area.get("name")
+                        area = self.service.get_area(area_id)
+                        if area:
+                            return area.get("name")
         except Exception as exc:
             logger.debug("Failed to resolve area for entity %s: %s", entity_id, exc)
         return None
@@ -1,9 +1,29 @@
 """Shared fixtures and configuration for tests"""
 
+import hashlib
+import json
 import os
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
+from dataclasses import dataclass, field
 from datetime import datetime, date, timezone, timedelta
+from types import SimpleNamespace
+from typing import Any, List, Optional
+from zoneinfo import ZoneInfo
+
+
+# ============================================================================
+# Command Line Options
+# ============================================================================
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--use-cached-mocks",
+        action="store_true",
+        default=False,
+        help="Reuse static Todoist resource outputs stored in .pytest_cache",
+    )
 
 
 # ============================================================================
@@ -11,95 +31,119 @@ from datetime import datetime, date, timezone, timedelta
 # ============================================================================
 
 
-class MockTodoistTask:
-    """Mock Todoist Task object"""
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat()
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id", "123")
-        self.content = kwargs.get("content", "Test Task")
-        self.description = kwargs.get("description", "")
-        self.is_completed = kwargs.get("is_completed", False)
-        self.labels = kwargs.get("labels", [])
-        self.priority = kwargs.get("priority", 1)
-        self.comment_count = kwargs.get("comment_count", 0)
-        self.created_at = kwargs.get(
-            "created_at", datetime.now(timezone.utc).isoformat()
-        )
-        self.creator_id = kwargs.get("creator_id", "user123")
-        self.assignee_id = kwargs.get("assignee_id", None)
-        self.assigner_id = kwargs.get("assigner_id", None)
-        self.project_id = kwargs.get("project_id", "proj123")
-        self.section_id = kwargs.get("section_id", None)
-        self.parent_id = kwargs.get("parent_id", None)
-        self.order = kwargs.get("order", 0)
-        self.url = kwargs.get("url", f"https://todoist.com/tasks/{self.id}")
-        self.due = kwargs.get("due", None)
-        self.duration = kwargs.get("duration", None)
 
+@dataclass(slots=True)
+class MockTodoistTask:
+    """Mock Todoist Task object"""
 
+    id: str = "123"
+    content: str = "Test Task"
+    description: str = ""
+    is_completed: bool = False
+    labels: List[str] = field(default_factory=list)
+    priority: int = 1
+    comment_count: int = 0
+    created_at: str = field(default_factory=_utc_now_iso)
+    creator_id: str = "user123"
+    assignee_id: Optional[str] = None
+    assigner_id: Optional[str] = None
+    project_id: str = "proj123"
+    section_id: Optional[str] = None
+    parent_id: Optional[str] = None
+    order: int = 0
+    url: Optional[str] = None
+    due: Any = None
+    duration: Any = None
+
+    def __post_init__(self):
+        if self.url is None:
+            self.url = f"https://todoist.com/tasks/{self.id}"
+
+
+@dataclass(slots=True)
 class MockTodoistDue:
     """Mock Todoist Due object"""
 
-    def __init__(self, **kwargs):
-        self.date = kwargs.get("date", date.today())
-        self.string = kwargs.get("string", "today")
-        self.datetime = kwargs.get("datetime", None)
-        self.timezone = kwargs.get("timezone", None)
-        self.is_recurring = kwargs.get("is_recurring", False)
+    date: Any = field(default_factory=date.today)
+    string: str = "today"
+    datetime: Any = None
+    timezone: Optional[str] = None
+    is_recurring: bool = False
 
 
-class MockTodoistProject:
-    """Mock Todoist Project object"""
+def MockTodoistDueCustom(
+    date=None, datetime_val=None, string=None, timezone=None, is_recurring=False
+):
+    """Mock Todoist Due object with every field unset unless given"""
+    return SimpleNamespace(
+        date=date,
+        datetime=datetime_val,
+        string=string,
+        timezone=timezone,
+        is_recurring=is_recurring,
+    )
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id", "proj123")
-        self.name = kwargs.get("name", "Test Project")
-        self.color = kwargs.get("color", "blue")
-        self.parent_id = kwargs.get("parent_id", None)
-        self.order = kwargs.get("order", 0)
-        self.is_shared = kwargs.get("is_shared", False)
-        self.is_favorite = kwargs.get("is_favorite", False)
-        self.is_inbox_project = kwargs.get("is_inbox_project", False)
-        self.is_archived = kwargs.get("is_archived", False)
-        self.is_collapsed = kwargs.get("is_collapsed", False)
-        self.view_style = kwargs.get("view_style", "list")
-        self.url = kwargs.get("url", f"https://todoist.com/projects/{self.id}")
-        self.description = kwargs.get("description", "")
-        self.workspace_id = kwargs.get("workspace_id", None)
-        self.folder_id = kwargs.get("folder_id", None)
 
+@dataclass(slots=True)
+class MockTodoistProject:
+    """Mock Todoist Project object"""
 
+    id: str = "proj123"
+    name: str = "Test Project"
+    color: str = "blue"
+    parent_id: Optional[str] = None
+    order: int = 0
+    is_shared: bool = False
+    is_favorite: bool = False
+    is_inbox_project: bool = False
+    is_archived: bool = False
+    is_collapsed: bool = False
+    view_style: str = "list"
+    url: Optional[str] = None
+    description: str = ""
+    workspace_id: Optional[str] = None
+    folder_id: Optional[str] = None
+
+    def __post_init__(self):
+        if self.url is None:
+            self.url = f"https://todoist.com/projects/{self.id}"
+
+
+@dataclass(slots=True)
 class MockTodoistLabel:
     """Mock Todoist Label object"""
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id", "label123")
-        self.name = kwargs.get("name", "test-label")
-        self.color = kwargs.get("color", "red")
-        self.order = kwargs.get("order", 0)
-        self.is_favorite = kwargs.get("is_favorite", False)
+    id: str = "label123"
+    name: str = "test-label"
+    color: str = "red"
+    order: int = 0
+    is_favorite: bool = False
 
 
+@dataclass(slots=True)
 class MockTodoistSection:
     """Mock Todoist Section object"""
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id", "section123")
-        self.name = kwargs.get("name", "Test Section")
-        self.project_id = kwargs.get("project_id", "proj123")
-        self.order = kwargs.get("order", 0)
+    id: str = "section123"
+    name: str = "Test Section"
+    project_id: str = "proj123"
+    order: int = 0
 
 
+@dataclass(slots=True)
 class MockTodoistComment:
     """Mock Todoist Comment object"""
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id", "comment123")
-        self.content = kwargs.get("content", "Test comment")
-        self.posted_at = kwargs.get("posted_at", datetime.now(timezone.utc).isoformat())
-        self.task_id = kwargs.get("task_id", None)
-        self.project_id = kwargs.get("project_id", None)
-        self.attachment = kwargs.get("attachment", None)
+    id: str = "comment123"
+    content: str = "Test comment"
+    posted_at: str = field(default_factory=_utc_now_iso)
+    task_id: Optional[str] = None
+    project_id: Optional[str] = None
+    attachment: Any = None
 
 
 # ============================================================================
@@ -107,70 +151,148 @@ class MockTodoistComment:
 # ============================================================================
 
 
-@pytest.fixture
-def mock_todoist_api():
-    """Mock TodoistAPI client"""
+def paged(items):
+    """Wrap items as a single-page iterator, as the Todoist API paginates"""
+    return iter((list(items),))
+
+
+def set_tasks(api, tasks):
+    """Make api.get_tasks() return a single fresh page of tasks"""
+    api.get_tasks.return_value = paged(tasks)
+
+
+def _install_todoist_defaults(mock_api):
+    """Setup default responses for common operations on a mock TodoistAPI"""
+    mock_api.get_projects.return_value = paged(
+        [
+            MockTodoistProject(id="1", name="Work"),
+            MockTodoistProject(id="2", name="Personal", is_inbox_project=True),
+        ]
+    )
+
+    mock_api.get_labels.return_value = paged(
+        [
+            MockTodoistLabel(id="1", name="urgent"),
+            MockTodoistLabel(id="2", name="work"),
+        ]
+    )
+
+    set_tasks(
+        mock_api,
+        [
+            MockTodoistTask(id="1", content="Task 1"),
+            MockTodoistTask(id="2", content="Task 2", priority=4),
+        ],
+    )
+
+    mock_api.add_task.return_value = MockTodoistTask(id="new123", content="New Task")
+
+    mock_api.update_task.return_value = MockTodoistTask(
+        id="123", content="Updated Task"
+    )
+
+    mock_api.complete_task.return_value = True
+    mock_api.uncomplete_task.return_value = True
+    mock_api.delete_task.return_value = True
+
+    mock_api.get_project.return_value = MockTodoistProject(id="1", name="Work")
+    mock_api.get_section.return_value = MockTodoistSection(id="1", name="In Progress")
+    mock_api.get_label.return_value = MockTodoistLabel(id="1", name="urgent")
+
+
+@pytest.fixture(scope="session")
+def todoist_api_class():
+    """TodoistAPI class patched once for the whole session"""
     with patch("services.todoist.TodoistAPI") as mock_api_class:
-        mock_api = MagicMock()
-        mock_api_class.return_value = mock_api
-
-        # Setup default responses for common operations
-        mock_api.get_projects.return_value = iter(
-            [
-                [
-                    MockTodoistProject(id="1", name="Work"),
-                    MockTodoistProject(id="2", name="Personal", is_inbox_project=True),
-                ]
-            ]
-        )
-
-        mock_api.get_labels.return_value = iter(
-            [
-                [
-                    MockTodoistLabel(id="1", name="urgent"),
-                    MockTodoistLabel(id="2", name="work"),
-                ]
-            ]
-        )
-
-        mock_api.get_tasks.return_value = iter(
-            [
-                [
-                    MockTodoistTask(id="1", content="Task 1"),
-                    MockTodoistTask(id="2", content="Task 2", priority=4),
-                ]
-            ]
-        )
-
-        mock_api.add_task.return_value = MockTodoistTask(
-            id="new123", content="New Task"
-        )
-
-        mock_api.update_task.return_value = MockTodoistTask(
-            id="123", content="Updated Task"
-        )
-
-        mock_api.complete_task.return_value = True
-        mock_api.uncomplete_task.return_value = True
-        mock_api.delete_task.return_value = True
-
-        mock_api.get_project.return_value = MockTodoistProject(id="1", name="Work")
-        mock_api.get_section.return_value = MockTodoistSection(
-            id="1", name="In Progress"
-        )
-        mock_api.get_label.return_value = MockTodoistLabel(id="1", name="urgent")
-
-        yield mock_api
+        mock_api_class.return_value = MagicMock()
+        yield mock_api_class
 
 
-@pytest.fixture
-def todoist_service(mock_todoist_api):
-    """Create TodoistService with mocked API"""
+def _build_todoist_service():
+    """Construct a TodoistService against the session-wide TodoistAPI patch"""
     with patch.dict(os.environ, {"TODOIST_API_TOKEN": "test_token", "TIMEZONE": "UTC"}):
         from services.todoist import TodoistService
 
-        service = TodoistService("test_token")
-        return service
+        return TodoistService("test_token")
+
+
+@pytest.fixture(scope="session")
+def _todoist_service_session(todoist_api_class):
+    """TodoistService and its mocked API client, built once per session"""
+    return _build_todoist_service(), todoist_api_class.return_value
+
+
+@pytest.fixture
+def mock_todoist_api(_todoist_service_session):
+    """Mock TodoistAPI client, reset to the default responses for each test"""
+    _, mock_api = _todoist_service_session
+    mock_api.reset_mock(return_value=True, side_effect=True)
+    _install_todoist_defaults(mock_api)
+    return mock_api
+
+
+@pytest.fixture
+def todoist_service(mock_todoist_api):
+    """Fresh TodoistService per test, sharing the session's API mock"""
+    return _build_todoist_service()
+
+
+def _todoist_source_digest():
+    """Short hash of services/todoist.py, used to version cached resources"""
+    import services.todoist as todoist_module
+
+    with open(todoist_module.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _json_round_trips(value):
+    """True if value comes back from JSON unchanged (str keys, no tuples)"""
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+def _static_resource(request, method_name):
+    """Call a static TodoistService resource method once per session
+
+    With --use-cached-mocks the result is also stored in .pytest_cache and
+    reused by later runs, skipping the service entirely. The cache key
+    includes a hash of services/todoist.py, so editing the service
+    invalidates stored results. Values that would not survive a JSON round
+    trip unchanged are never cached.
+    """
+    cache = getattr(request.config, "cache", None)
+    use_cache = cache is not None and request.config.getoption("use_cached_mocks")
+    if use_cache:
+        key = f"todoist/{method_name}/{_todoist_source_digest()}"
+        value = cache.get(key, None)
+        if value is not None:
+            return value
+
+    service, _ = request.getfixturevalue("_todoist_service_session")
+    value = getattr(service, method_name)()
+    if use_cache and _json_round_trips(value):
+        cache.set(key, value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def priorities_resource(request):
+    """Static priorities resource, computed once per session"""
+    return _static_resource(request, "get_priorities_resource")
+
+
+@pytest.fixture(scope="session")
+def colors_resource(request):
+    """Static colors resource, computed once per session"""
+    return _static_resource(request, "get_colors_resource")
+
+
+@pytest.fixture(scope="session")
+def common_filters_resource(request):
+    """Static common filters resource, computed once per session"""
+    return _static_resource(request, "get_common_filters_resource")
 
 
 # ============================================================================
@@ -193,7 +315,24 @@ def mock_websocket():
         yield mock_ws
 
 
+@pytest.fixture(scope="module")
+def _ha_service_module():
+    """HomeAssistantService built once per test module"""
+    from services.homeassistant import HomeAssistantService
+
+    service = HomeAssistantService("http://localhost", "token")
+    yield service
+    service.close()
+
+
 @pytest.fixture
+def ha_service(_ha_service_module):
+    """Shared HomeAssistantService with its caches cleared for each test"""
+    _ha_service_module.clear_cache()
+    return _ha_service_module
+
+
+@pytest.fixture(scope="session")
 def mock_ha_responses():
     """Mock Home Assistant API responses"""
     return {
@@ -228,7 +367,7 @@ def homeassistant_client(mock_websocket, mock_ha_responses):
     with patch.dict(
         os.environ, {"HA_URL": "http://localhost:8123", "HA_TOKEN": "test_token"}
     ):
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = mock_ha_responses["states"]
             mock_get.return_value.status_code = 200
 
@@ -423,34 +562,46 @@ def test_dates():
     }
 
 
+@pytest.fixture
+def utc_today():
+    """Today's date in UTC and the UTC ZoneInfo used to compute it"""
+    tz = ZoneInfo("UTC")
+    return datetime.now(tz).date(), tz
+
+
+@pytest.fixture
+def eastern_today():
+    """Today's date in US/Eastern and the US/Eastern ZoneInfo"""
+    tz = ZoneInfo("US/Eastern")
+    return datetime.now(tz).date(), tz
+
+
 @pytest.fixture
 def test_priorities():
     """Todoist priority mappings"""
     return {"urgent": 4, "high": 3, "medium": 2, "low": 1, "default": 1}
 
 
-@pytest.fixture
-def test_colors():
-    """Todoist color options"""
-    return [
-        "berry_red",
-        "red",
-        "orange",
-        "yellow",
-        "olive_green",
-        "lime_green",
-        "green",
-        "mint_green",
-        "teal",
-        "sky_blue",
-        "light_blue",
-        "blue",
-        "grape",
-        "violet",
-        "lavender",
-        "magenta",
-        "salmon",
-        "charcoal",
-        "grey",
-        "taupe",
-    ]
+# Todoist color options
+TEST_COLORS = (
+    "berry_red",
+    "red",
+    "orange",
+    "yellow",
+    "olive_green",
+    "lime_green",
+    "green",
+    "mint_green",
+    "teal",
+    "sky_blue",
+    "light_blue",
+    "blue",
+    "grape",
+    "violet",
+    "lavender",
+    "magenta",
+    "salmon",
+    "charcoal",
+    "grey",
+    "taupe",
+)
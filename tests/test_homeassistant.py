@@ -1,5 +1,6 @@
 """Unit tests for Home Assistant service"""
 
+import json
 import pytest
 from unittest.mock import patch, Mock
 import requests
@@ -7,9 +8,69 @@ from services.homeassistant import (
     HomeAssistantService,
     HomeAssistantClient,
     ConnectionType,
+    orjson,
 )
 
 
+class FakeService:
+    """Lightweight stand-in for HomeAssistantService in client delegation tests"""
+
+    areas_ret = None
+    call_ret = None
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def get_areas(self, *args, **kwargs):
+        self.calls.append(("get_areas", args, kwargs))
+        return FakeService.areas_ret
+
+    def call_service(self, *args, **kwargs):
+        self.calls.append(("call_service", args, kwargs))
+        return FakeService.call_ret
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    content = None
+
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        pass
+
+
+class Capture:
+    """Callable stub that records its last call and returns a canned response"""
+
+    def __init__(self, resp):
+        self.resp = resp
+        self.args = None
+        self.kwargs = None
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.count += 1
+        return self.resp
+
+
+def assert_post_to(stub, url_contains, json_contains):
+    """Assert the last POST hit a matching URL and carried the given JSON fields"""
+    call = stub.call_args if isinstance(stub, Mock) else stub
+    url = call.args[0] if call.args else call.kwargs.get("url", "")
+    assert url_contains in url
+    for key, value in json_contains.items():
+        assert call.kwargs["json"][key] == value
+
+
 class TestHomeAssistantService:
     """Test suite for HomeAssistantService (REST API)"""
 
@@ -38,110 +99,131 @@ class TestHomeAssistantService:
         )
         assert service.url == "http://localhost:8123"
 
+    def test_init_creates_pooled_session(self, ha_service):
+        """Test that a persistent session carries auth headers"""
+        assert isinstance(ha_service._session, requests.Session)
+        assert ha_service._session.headers["Authorization"] == "Bearer token"
+        assert ha_service._session.get_adapter("https://localhost") is (
+            ha_service._session.get_adapter("http://localhost")
+        )
+
+    def test_verify_ssl_false_survives_ca_bundle_env(self, monkeypatch):
+        """Test that REQUESTS_CA_BUNDLE does not re-enable SSL verification"""
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/tmp/ca-bundle.pem")
+        service = HomeAssistantService(
+            "https://localhost:8123", "token", verify_ssl=False
+        )
+        kwargs = service._req_kwargs
+        settings = service._session.merge_environment_settings(
+            service._api_root, {}, None, kwargs["verify"], None
+        )
+        assert settings["verify"] is False
+
+    @patch("requests.Session.close")
+    def test_context_manager_closes_session(self, mock_close):
+        """Test that leaving the context closes the session"""
+        with HomeAssistantService("http://localhost", "token") as service:
+            assert service.url == "http://localhost"
+        mock_close.assert_called_once()
+
     # ========== VALIDATION TESTS ==========
 
-    def test_validate_entity_id_valid(self):
+    def test_validate_entity_id_valid(self, ha_service):
         """Test entity ID validation with valid IDs"""
-        service = HomeAssistantService("http://localhost", "token")
-
         # Single entity
-        service._validate_entity_id("light.living_room")  # Should not raise
+        ha_service._validate_entity_id("light.living_room")  # Should not raise
 
         # Multiple entities
-        service._validate_entity_id(
+        ha_service._validate_entity_id(
             ["light.bedroom", "switch.garage"]
         )  # Should not raise
 
-    def test_validate_entity_id_invalid_format(self):
+    def test_validate_entity_id_invalid_format(self, ha_service):
         """Test entity ID validation with invalid format"""
-        service = HomeAssistantService("http://localhost", "token")
-
         with pytest.raises(ValueError, match="Invalid entity_id format"):
-            service._validate_entity_id("invalid_entity")
+            ha_service._validate_entity_id("invalid_entity")
 
-    def test_validate_entity_id_invalid_domain(self):
+    def test_validate_entity_id_invalid_domain(self, ha_service):
         """Test entity ID validation with invalid domain"""
-        service = HomeAssistantService("http://localhost", "token")
-
         with pytest.raises(ValueError, match="Invalid domain"):
-            service._validate_entity_id("invalid_domain.entity")
+            ha_service._validate_entity_id("invalid_domain.entity")
 
-    def test_validate_domain_valid(self):
+    def test_validate_domain_valid(self, ha_service):
         """Test domain validation with valid domains"""
-        service = HomeAssistantService("http://localhost", "token")
-
         for domain in ["light", "switch", "sensor", "climate"]:
-            service._validate_domain(domain)  # Should not raise
+            ha_service._validate_domain(domain)  # Should not raise
 
-    def test_validate_domain_invalid(self):
+    def test_validate_domain_invalid(self, ha_service):
         """Test domain validation with invalid domain"""
-        service = HomeAssistantService("http://localhost", "token")
-
         with pytest.raises(ValueError, match="Invalid domain"):
-            service._validate_domain("invalid_domain")
+            ha_service._validate_domain("invalid_domain")
 
     @pytest.mark.parametrize(
         "brightness,expected",
         [(0, 0), (128, 128), (255, 255), ("100", 100), (None, None)],
     )
-    def test_validate_brightness_valid(self, brightness, expected):
+    def test_validate_brightness_valid(self, ha_service, brightness, expected):
         """Test brightness validation with valid values"""
-        service = HomeAssistantService("http://localhost", "token")
-        result = service._validate_brightness(brightness)
+        result = ha_service._validate_brightness(brightness)
         assert result == expected
 
     @pytest.mark.parametrize("brightness", [-1, 256, 1000, "invalid"])
-    def test_validate_brightness_invalid(self, brightness):
+    def test_validate_brightness_invalid(self, ha_service, brightness):
         """Test brightness validation with invalid values"""
-        service = HomeAssistantService("http://localhost", "token")
-
         with pytest.raises(ValueError, match="Invalid brightness"):
-            service._validate_brightness(brightness)
+            ha_service._validate_brightness(brightness)
 
-    def test_validate_temperature_celsius_valid(self):
+    def test_validate_temperature_celsius_valid(self, ha_service):
         """Test temperature validation in Celsius"""
-        service = HomeAssistantService("http://localhost", "token")
-        service._validate_temperature(22.0, "C")  # Should not raise
-        service._validate_temperature(-10.0, "C")  # Should not raise
+        ha_service._validate_temperature(22.0, "C")  # Should not raise
+        ha_service._validate_temperature(-10.0, "C")  # Should not raise
 
-    def test_validate_temperature_celsius_invalid(self):
+    def test_validate_temperature_celsius_invalid(self, ha_service):
         """Test temperature validation with invalid Celsius"""
-        service = HomeAssistantService("http://localhost", "token")
-
         with pytest.raises(ValueError, match="Invalid temperature"):
-            service._validate_temperature(100.0, "C")
+            ha_service._validate_temperature(100.0, "C")
 
     # ========== STATE OPERATION TESTS ==========
 
-    @patch("requests.get")
-    def test_get_states(self, mock_get):
+    @patch("requests.Session.get")
+    def test_get_states(self, mock_get, ha_service):
         """Test getting entity states"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.json.return_value = [
             {"entity_id": "light.living_room", "state": "on"},
             {"entity_id": "sensor.temperature", "state": "22.5"},
         ]
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_get.return_value = mock_response
 
-        states = service.get_states()
+        states = ha_service.get_states()
 
         assert len(states) == 2
         assert states[0]["entity_id"] == "light.living_room"
         mock_get.assert_called_once_with(
             "http://localhost/api/states",
-            headers=service.headers,
-            timeout=service.timeout,
-            verify=service.verify_ssl,
+            timeout=ha_service.timeout,
+            verify=ha_service.verify_ssl,
         )
 
-    @patch("requests.get")
-    def test_get_states_with_filter(self, mock_get):
-        """Test getting specific entity states"""
-        service = HomeAssistantService("http://localhost", "token")
+    @pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+    @patch("requests.Session.get")
+    def test_get_states_decodes_raw_content(self, mock_get, ha_service):
+        """Test that a raw bytes body is decoded without Response.json()"""
+        payload = [{"entity_id": "light.living_room", "state": "on"}]
+        mock_response = Mock()
+        mock_response.content = json.dumps(payload).encode()
+        mock_response.json.side_effect = AssertionError(
+            "Response.json() should be bypassed"
+        )
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
 
+        assert ha_service.get_states() == payload
+
+    @patch("requests.Session.get")
+    def test_get_states_with_filter(self, mock_get, ha_service):
+        """Test getting specific entity states"""
         mock_response = Mock()
         mock_response.json.return_value = [
             {
@@ -151,121 +233,154 @@ class TestHomeAssistantService:
             },
             {"entity_id": "light.bedroom", "state": "off", "attributes": {}},
         ]
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_get.return_value = mock_response
 
-        states = service.get_states(entity_ids=["light.living_room"])
+        states = ha_service.get_states(entity_ids=["light.living_room"])
 
         # Should filter to just the requested entity
         assert len(states) == 1
         assert states[0]["entity_id"] == "light.living_room"
         mock_get.assert_called_once()
 
-    @patch("requests.post")
-    def test_set_state(self, mock_post):
+    @patch("requests.Session.post")
+    def test_set_state(self, mock_post, ha_service):
         """Test setting entity state"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.json.return_value = {
             "entity_id": "input_text.test",
             "state": "new_value",
         }
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_post.return_value = mock_response
 
-        result = service.set_state(
+        result = ha_service.set_state(
             "input_text.test", "new_value", {"friendly_name": "Test Input"}
         )
 
         assert result["state"] == "new_value"
         mock_post.assert_called_once()
+        assert_post_to(
+            mock_post,
+            "/api/states/input_text.test",
+            {"state": "new_value", "attributes": {"friendly_name": "Test Input"}},
+        )
 
     # ========== SERVICE CALL TESTS ==========
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch.object(HomeAssistantService, "_validate_service")
-    def test_call_service_basic(self, mock_validate, mock_post):
+    def test_call_service_basic(self, mock_validate, mock_post, ha_service):
         """Test calling a basic service"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
         mock_post.return_value = mock_response
 
         # Pass entity_id as a direct parameter, not in service_data
-        result = service.call_service("light", "turn_on", entity_id="light.living_room")
+        result = ha_service.call_service(
+            "light", "turn_on", entity_id="light.living_room"
+        )
 
         assert result == {"status": "success", "domain": "light", "service": "turn_on"}
-        mock_post.assert_called_once_with(
-            "http://localhost/api/services/light/turn_on",
-            headers=service.headers,
-            json={"entity_id": "light.living_room"},
-            timeout=service.timeout,
-            verify=service.verify_ssl,
+        mock_post.assert_called_once()
+        assert_post_to(
+            mock_post, "/services/light/turn_on", {"entity_id": "light.living_room"}
         )
 
-    @patch("requests.post")
-    def test_turn_on_light(self, mock_post):
-        """Test turning on a light with brightness"""
-        service = HomeAssistantService("http://localhost", "token")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_call_service_rejects_unknown_service(
+        self, mock_get, mock_post, ha_service
+    ):
+        """Test that a service missing from the registry is rejected"""
+        mock_get.return_value = FakeResponse({"light": {"services": {"turn_on": {}}}})
 
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        with pytest.raises(ValueError, match="Invalid service 'bogus_service'"):
+            ha_service.call_service("light", "bogus_service")
+        mock_post.assert_not_called()
 
-        service.turn_on("light.living_room", brightness=200, color_temp=3000)
+    def test_turn_on_light(self, ha_service, monkeypatch):
+        """Test turning on a light with brightness"""
+        cap = Capture(FakeResponse([]))
+        monkeypatch.setattr("requests.Session.post", cap)
 
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[1]["json"]["entity_id"] == "light.living_room"
-        assert call_args[1]["json"]["brightness"] == 200
-        assert call_args[1]["json"]["color_temp"] == 3000
+        ha_service.turn_on("light.living_room", brightness=200, color_temp=3000)
 
-    @patch("requests.post")
-    def test_turn_off_entity(self, mock_post):
-        """Test turning off an entity"""
-        service = HomeAssistantService("http://localhost", "token")
+        assert cap.count == 1
+        assert_post_to(
+            cap,
+            "light/turn_on",
+            {"entity_id": "light.living_room", "brightness": 200, "color_temp": 3000},
+        )
 
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+    def test_turn_off_entity(self, ha_service, monkeypatch):
+        """Test turning off an entity"""
+        cap = Capture(FakeResponse([]))
+        monkeypatch.setattr("requests.Session.post", cap)
 
-        service.turn_off("switch.garage")
+        ha_service.turn_off("switch.garage")
 
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert "switch/turn_off" in call_args[0][0]
-        assert call_args[1]["json"]["entity_id"] == "switch.garage"
+        assert cap.count == 1
+        assert_post_to(cap, "switch/turn_off", {"entity_id": "switch.garage"})
 
-    @patch("requests.post")
-    def test_toggle_entity(self, mock_post):
+    def test_toggle_entity(self, ha_service, monkeypatch):
         """Test toggling an entity"""
-        service = HomeAssistantService("http://localhost", "token")
-
+        cap = Capture(FakeResponse([]))
+        monkeypatch.setattr("requests.Session.post", cap)
+
+        ha_service.toggle("light.bedroom")
+
+        assert cap.count == 1
+        assert_post_to(cap, "light/toggle", {"entity_id": "light.bedroom"})
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_call_services_batch(self, mock_get, mock_post, ha_service):
+        """Test batch calls validate once, keep input order and report errors"""
+        registry = Mock()
+        registry.status_code = 200
+        registry.json.return_value = {
+            domain: {"services": {"turn_on": {}, "turn_off": {}, "toggle": {}}}
+            for domain in ("light", "switch", "fan")
+        }
+        mock_get.return_value = registry
         mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_post.return_value = mock_response
 
-        service.toggle("light.bedroom")
+        calls = [
+            {"domain": domain, "service": service, "entity_id": f"{domain}.{service}"}
+            for domain in ("light", "switch", "fan")
+            for service in ("turn_on", "turn_off", "toggle")
+        ]
+        calls.append({"domain": "bogus", "service": "turn_on"})
+        calls.append({"domain": "light", "service": "bogus_service"})
 
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert "light/toggle" in call_args[0][0]
+        results = ha_service.call_services_batch(calls)
+
+        assert len(results) == 11
+        assert results[:9] == [
+            {"status": "success", "domain": c["domain"], "service": c["service"]}
+            for c in calls[:9]
+        ]
+        assert results[9]["status"] == "error"
+        assert "Invalid domain" in results[9]["error"]
+        assert results[10]["status"] == "error"
+        assert "Invalid service 'bogus_service'" in results[10]["error"]
+        # The registry is fetched once for the whole batch
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0] == "http://localhost/api/services"
+        assert mock_post.call_count == 9
+        posted = {c.kwargs["json"]["entity_id"] for c in mock_post.call_args_list}
+        assert posted == {c["entity_id"] for c in calls[:9]}
 
     # ========== AREA AND DEVICE TESTS ==========
 
     @patch("services.homeassistant.HomeAssistantService._get_areas_via_websocket")
-    @patch("requests.get")
-    def test_get_areas(self, mock_get, mock_websocket):
+    @patch("requests.Session.get")
+    def test_get_areas(self, mock_get, mock_websocket, ha_service):
         """Test getting areas"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = [
@@ -274,7 +389,7 @@ class TestHomeAssistantService:
         ]
         mock_get.return_value = mock_response
 
-        areas = service.get_areas()
+        areas = ha_service.get_areas()
 
         assert len(areas) == 2
         # Default is minimal=True, so we get 'id' not 'area_id'
@@ -282,15 +397,13 @@ class TestHomeAssistantService:
         assert areas[0]["name"] == "Living Room"
         assert "floor" in areas[0]  # Minimal format includes floor
         # Check caching - cache stores full data, not minimal
-        assert service.areas_cache[0]["area_id"] == "living_room"
-        assert service.areas_cache[0]["name"] == "Living Room"
+        assert ha_service.areas_cache[0]["area_id"] == "living_room"
+        assert ha_service.areas_cache[0]["name"] == "Living Room"
 
     @patch("services.homeassistant.HomeAssistantService._get_areas_via_websocket")
-    @patch("requests.get")
-    def test_get_areas_non_minimal(self, mock_get, mock_websocket):
+    @patch("requests.Session.get")
+    def test_get_areas_non_minimal(self, mock_get, mock_websocket, ha_service):
         """Test getting areas with minimal=False"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = [
@@ -305,7 +418,7 @@ class TestHomeAssistantService:
         mock_get.return_value = mock_response
 
         # Get areas with minimal=False
-        areas = service.get_areas(minimal=False)
+        areas = ha_service.get_areas(minimal=False)
 
         assert len(areas) == 2
         # Non-minimal format should have original structure
@@ -316,20 +429,38 @@ class TestHomeAssistantService:
         # Should be exactly what was returned
         assert areas == mock_response.json.return_value
 
-    @patch("requests.get")
-    def test_get_devices(self, mock_get):
-        """Test getting devices"""
-        service = HomeAssistantService("http://localhost", "token")
+    @patch("services.homeassistant.HomeAssistantService._get_areas_via_websocket")
+    @patch("requests.Session.get")
+    def test_get_area_by_id(self, mock_get, mock_websocket, ha_service):
+        """Test area lookup by ID from the cached area list"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [
+            {"area_id": "living_room", "name": "Living Room"},
+            {"area_id": "bedroom", "name": "Bedroom"},
+        ]
+        mock_get.return_value = mock_response
+
+        assert ha_service.get_area("bedroom")["name"] == "Bedroom"
+        assert ha_service.get_area("garage") is None
+        # Later calls are served from cache; each gets its own minimal list
+        first = ha_service.get_areas()
+        first[0]["name"] = "Changed"
+        assert ha_service.get_areas()[0]["name"] == "Living Room"
+        mock_get.assert_called_once()
 
+    @patch("requests.Session.get")
+    def test_get_devices(self, mock_get, ha_service):
+        """Test getting devices"""
         mock_response = Mock()
         mock_response.json.return_value = [
             {"id": "device1", "name": "Smart Light", "area_id": "living_room"},
             {"id": "device2", "name": "Thermostat", "area_id": "hallway"},
         ]
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_get.return_value = mock_response
 
-        devices = service.get_devices()
+        devices = ha_service.get_devices()
 
         assert len(devices) == 2
         # Default is minimal=True, check for minimal fields
@@ -340,14 +471,12 @@ class TestHomeAssistantService:
         assert "model" in devices[0]
         assert "entities" in devices[0]
         # Check caching - cache stores full data, not minimal
-        assert service.devices_cache[0]["id"] == "device1"
-        assert service.devices_cache[0]["name"] == "Smart Light"
+        assert ha_service.devices_cache[0]["id"] == "device1"
+        assert ha_service.devices_cache[0]["name"] == "Smart Light"
 
-    @patch("requests.get")
-    def test_get_devices_non_minimal(self, mock_get):
+    @patch("requests.Session.get")
+    def test_get_devices_non_minimal(self, mock_get, ha_service):
         """Test getting devices with minimal=False"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.json.return_value = [
             {
@@ -363,11 +492,11 @@ class TestHomeAssistantService:
                 "hw_version": "2.0",
             },
         ]
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_get.return_value = mock_response
 
         # Get devices with minimal=False
-        devices = service.get_devices(minimal=False)
+        devices = ha_service.get_devices(minimal=False)
 
         assert len(devices) == 2
         # Non-minimal format should have all original fields
@@ -378,41 +507,37 @@ class TestHomeAssistantService:
         # Should be exactly what was returned
         assert devices == mock_response.json.return_value
 
-    @patch("requests.get")
-    def test_get_devices_with_pagination(self, mock_get):
+    @patch("requests.Session.get")
+    def test_get_devices_with_pagination(self, mock_get, ha_service):
         """Test getting devices with pagination"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.json.return_value = [
             {"id": f"device{i}", "name": f"Device {i}", "area_id": "room"}
             for i in range(10)
         ]
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_get.return_value = mock_response
 
         # Get first 3 devices
-        devices = service.get_devices(limit=3, offset=0)
+        devices = ha_service.get_devices(limit=3, offset=0)
         assert len(devices) == 3
         assert devices[0]["id"] == "device0"
         assert devices[2]["id"] == "device2"
 
         # Get next 3 devices
-        devices = service.get_devices(limit=3, offset=3)
+        devices = ha_service.get_devices(limit=3, offset=3)
         assert len(devices) == 3
         assert devices[0]["id"] == "device3"
         assert devices[2]["id"] == "device5"
 
         # Get devices with offset only
-        devices = service.get_devices(offset=7)
+        devices = ha_service.get_devices(offset=7)
         assert len(devices) == 3
         assert devices[0]["id"] == "device7"
 
     @patch("services.homeassistant.HomeAssistantService.get_states")
-    def test_get_entities(self, mock_get_states):
+    def test_get_entities(self, mock_get_states, ha_service):
         """Test getting entities with default minimal=True"""
-        service = HomeAssistantService("http://localhost", "token")
-
         # Mock states that entities are derived from
         mock_get_states.return_value = [
             {
@@ -427,7 +552,7 @@ class TestHomeAssistantService:
             }
         ]
 
-        entities = service.get_entities()
+        entities = ha_service.get_entities()
 
         assert len(entities) == 1
         # Default minimal=True should only have essential fields
@@ -441,10 +566,8 @@ class TestHomeAssistantService:
         assert "unit_of_measurement" not in entities[0]
 
     @patch("services.homeassistant.HomeAssistantService.get_states")
-    def test_get_entities_non_minimal(self, mock_get_states):
+    def test_get_entities_non_minimal(self, mock_get_states, ha_service):
         """Test getting entities with minimal=False"""
-        service = HomeAssistantService("http://localhost", "token")
-
         # Mock states that entities are derived from
         mock_get_states.return_value = [
             {
@@ -461,7 +584,7 @@ class TestHomeAssistantService:
             }
         ]
 
-        entities = service.get_entities(minimal=False)
+        entities = ha_service.get_entities(minimal=False)
 
         assert len(entities) == 1
         # Non-minimal should have all fields
@@ -477,10 +600,8 @@ class TestHomeAssistantService:
         assert not entities[0]["disabled"]
 
     @patch("services.homeassistant.HomeAssistantService.get_states")
-    def test_get_entities_with_pagination(self, mock_get_states):
+    def test_get_entities_with_pagination(self, mock_get_states, ha_service):
         """Test getting entities with pagination"""
-        service = HomeAssistantService("http://localhost", "token")
-
         # Mock states for 10 entities
         mock_get_states.return_value = [
             {
@@ -495,65 +616,87 @@ class TestHomeAssistantService:
         ]
 
         # Get first 4 entities
-        entities = service.get_entities(limit=4, offset=0)
+        entities = ha_service.get_entities(limit=4, offset=0)
         assert len(entities) == 4
         assert entities[0]["entity_id"] == "sensor.test_0"
         assert entities[3]["entity_id"] == "sensor.test_3"
 
         # Get next 4 entities
-        entities = service.get_entities(limit=4, offset=4)
+        entities = ha_service.get_entities(limit=4, offset=4)
         assert len(entities) == 4
         assert entities[0]["entity_id"] == "sensor.test_4"
         assert entities[3]["entity_id"] == "sensor.test_7"
 
         # Get entities with offset only
-        entities = service.get_entities(offset=8)
+        entities = ha_service.get_entities(offset=8)
         assert len(entities) == 2
         assert entities[0]["entity_id"] == "sensor.test_8"
         assert entities[1]["entity_id"] == "sensor.test_9"
 
-    @patch("requests.get")
-    def test_get_history_with_pagination(self, mock_get):
+    @patch("requests.Session.get")
+    def test_get_history_with_pagination(self, mock_get, ha_service):
         """Test getting history with pagination"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         # History API returns nested list
         mock_response.json.return_value = [
             [
-                {"state": f"state_{i}", "last_changed": f"2024-01-01T{i:02d}:00:00"}
+                {
+                    "state": f"state_{i}",
+                    "last_changed": f"2024-01-01T{i:02d}:00:00+00:00",
+                }
                 for i in range(10)
             ]
         ]
-        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
         mock_get.return_value = mock_response
 
         # Get first 3 history entries
-        history = service.get_history("sensor.test", limit=3, offset=0)
+        history = ha_service.get_history("sensor.test", limit=3, offset=0)
         assert len(history) == 3
         assert history[0]["state"] == "state_0"
         assert history[2]["state"] == "state_2"
+        assert history[0]["last_changed"] == "2024-01-01T00:00:00+00:00"
+        assert history[0]["last_changed_ts"] == 1704067200.0
+        assert history[2]["last_changed_ts"] - history[0]["last_changed_ts"] == 7200
 
         # Get next 3 history entries
-        history = service.get_history("sensor.test", limit=3, offset=3)
+        history = ha_service.get_history("sensor.test", limit=3, offset=3)
         assert len(history) == 3
         assert history[0]["state"] == "state_3"
         assert history[2]["state"] == "state_5"
 
         # Get history with offset only
-        history = service.get_history("sensor.test", offset=7)
+        history = ha_service.get_history("sensor.test", offset=7)
         assert len(history) == 3
         assert history[0]["state"] == "state_7"
         assert history[2]["state"] == "state_9"
 
+    @patch("requests.Session.get")
+    def test_get_history_tolerates_odd_timestamps(self, mock_get, ha_service):
+        """Test that naive timestamps are read as UTC and bad ones are skipped"""
+        mock_response = Mock()
+        mock_response.json.return_value = [
+            [
+                {"state": "on", "last_changed": "2024-01-01T00:00:00"},
+                {"state": "off", "last_changed": "not-a-timestamp"},
+            ]
+        ]
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        history = ha_service.get_history("sensor.test")
+        assert len(history) == 2
+        assert history[0]["last_changed_ts"] == 1704067200.0
+        assert "last_changed_ts" not in history[1]
+        assert history[1]["last_changed"] == "not-a-timestamp"
+
     # ========== ERROR HANDLING TESTS ==========
 
-    @patch("requests.get")
-    def test_api_error_handling(self, mock_get):
+    @patch("requests.Session.get")
+    def test_api_error_handling(self, mock_get, ha_service):
         """Test API error handling"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
+        mock_response.status_code = 500
         mock_response.raise_for_status.side_effect = requests.RequestException(
             "Connection error"
         )
@@ -561,13 +704,11 @@ class TestHomeAssistantService:
 
         # get_states raises ValueError on connection error
         with pytest.raises(ValueError, match="Failed to retrieve"):
-            service.get_states()
+            ha_service.get_states()
 
-    @patch("requests.get")
-    def test_authentication_error(self, mock_get):
+    @patch("requests.Session.get")
+    def test_authentication_error(self, mock_get, ha_service):
         """Test authentication error handling"""
-        service = HomeAssistantService("http://localhost", "token")
-
         mock_response = Mock()
         mock_response.status_code = 401
         mock_response.raise_for_status.side_effect = requests.HTTPError(
@@ -577,7 +718,7 @@ class TestHomeAssistantService:
 
         # get_states raises ValueError on auth error
         with pytest.raises(ValueError, match="401 Unauthorized"):
-            service.get_states()
+            ha_service.get_states()
 
 
 class TestHomeAssistantClient:
@@ -585,7 +726,7 @@ class TestHomeAssistantClient:
 
     # ========== INITIALIZATION TESTS ==========
 
-    def test_init_client(self, mock_websocket):
+    def test_init_client(self):
         """Test client initialization"""
         client = HomeAssistantClient(
             url="http://localhost:8123", access_token="test_token"
@@ -593,7 +734,7 @@ class TestHomeAssistantClient:
         assert client.url == "http://localhost:8123"
         assert client.access_token == "test_token"
 
-    def test_init_with_ssl(self, mock_websocket):
+    def test_init_with_ssl(self):
         """Test client initialization with SSL"""
         client = HomeAssistantClient(
             url="https://localhost:8123", access_token="test_token", verify_ssl=False
@@ -603,7 +744,7 @@ class TestHomeAssistantClient:
 
     # ========== WEBSOCKET CONNECTION TESTS ==========
 
-    def test_service_wrapper_methods(self, mock_websocket):
+    def test_service_wrapper_methods(self):
         """Test that HomeAssistantClient properly wraps HomeAssistantService"""
         client = HomeAssistantClient(
             url="http://localhost:8123", access_token="test_token"
@@ -619,40 +760,41 @@ class TestHomeAssistantClient:
 
     # ========== WRAPPER METHOD TESTS ==========
 
-    @patch.object(HomeAssistantService, "get_areas")
-    def test_get_areas_wrapper(self, mock_get_areas, mock_websocket):
+    def test_get_areas_wrapper(self, monkeypatch):
         """Test that get_areas is properly wrapped"""
-        client = HomeAssistantClient(
-            url="http://localhost:8123", access_token="test_token"
-        )
-
-        mock_get_areas.return_value = [
+        monkeypatch.setattr("services.homeassistant.HomeAssistantService", FakeService)
+        FakeService.areas_ret = [
             {"area_id": "living_room", "name": "Living Room"},
             {"area_id": "bedroom", "name": "Bedroom"},
         ]
+        client = HomeAssistantClient(
+            url="http://localhost:8123", access_token="test_token"
+        )
 
         areas = client.get_areas()
 
         assert len(areas) == 2
         assert areas[0]["name"] == "Living Room"
-        mock_get_areas.assert_called_once()
+        assert client.service.calls == [("get_areas", (), {})]
 
-    @patch.object(HomeAssistantService, "call_service")
-    def test_call_service_wrapper(self, mock_call_service, mock_websocket):
+    def test_call_service_wrapper(self, monkeypatch):
         """Test that call_service is properly wrapped"""
+        monkeypatch.setattr("services.homeassistant.HomeAssistantService", FakeService)
+        FakeService.call_ret = {"status": "success"}
         client = HomeAssistantClient(
             url="http://localhost:8123", access_token="test_token"
         )
 
-        mock_call_service.return_value = {"status": "success"}
-
         result = client.call_service(
             domain="light", service="turn_on", entity_id="light.living_room"
         )
 
         assert result == {"status": "success"}
-        mock_call_service.assert_called_once_with(
-            "light",
-            "turn_on",
-            "light.living_room",  # entity_id is passed as positional arg
-        )
+        assert client.service.calls == [
+            (
+                "call_service",
+                # entity_id is passed as positional arg
+                ("light", "turn_on", "light.living_room"),
+                {},
+            )
+        ]
@@ -1,7 +1,7 @@
 """Unit tests for Todoist service"""
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import call
 from datetime import date
 from services.todoist import TodoistService
 from tests.conftest import (
@@ -9,62 +9,118 @@ from tests.conftest import (
     MockTodoistProject,
     MockTodoistLabel,
     MockTodoistDue,
+    MockTodoistSection,
+    TEST_COLORS,
+    paged,
+    set_tasks,
 )
 
+# The service and API mock are shared per session; reset the mock before every
+# test here so results do not depend on test order (e.g. under pytest-randomly)
+pytestmark = pytest.mark.usefixtures("mock_todoist_api")
 
-class TestTodoistService:
-    """Test suite for TodoistService"""
-
-    # ========== INITIALIZATION TESTS ==========
+# Date-independent tasks, built once at import and shared across tests
+_TEN_TASKS = tuple(
+    MockTodoistTask(id=str(i), content=f"Task {i}", priority=1) for i in range(10)
+)
+_NO_DUE_TASK = MockTodoistTask(id="3", content="No Due Date")
+_STATS_PRIORITY_TASKS = (
+    MockTodoistTask(id="1", priority=4),
+    MockTodoistTask(id="2", priority=3),
+    MockTodoistTask(id="3", priority=1),
+)
 
-    def test_init_with_token(self):
+# API errors are only re-raised by side_effect, so one instance per kind is enough
+_AUTH_ERR = Exception("401 Unauthorized")
+_NOT_FOUND_ERR = Exception("404 Not Found")
+
+# (validator, argument, expected error match or None if the value is valid)
+VALIDATOR_CASES = [
+    ("_validate_priority", "5", "Invalid priority"),
+    ("_validate_priority", "0", "Invalid priority"),
+    ("_validate_priority", "-1", "Invalid priority"),
+    ("_validate_priority", "invalid", "Invalid priority"),
+    ("_validate_priority", 5, "Invalid priority"),
+    ("_validate_priority", 0, "Invalid priority"),
+    ("_validate_duration_unit", "minute", None),
+    ("_validate_duration_unit", "day", None),
+    ("_validate_duration_unit", None, None),
+    ("_validate_duration_unit", "hour", "Invalid duration_unit"),
+    ("_validate_duration_unit", "week", "Invalid duration_unit"),
+    ("_validate_duration_unit", "invalid", "Invalid duration_unit"),
+    ("_validate_due_date_format", "2024-12-31", None),
+    ("_validate_due_date_format", "2024-01-01", None),
+    ("_validate_due_date_format", "2025-06-15", None),
+    ("_validate_due_date_format", "12/31/2024", "Invalid due_date format"),
+    ("_validate_due_date_format", "2024-13-01", "Invalid due_date format"),
+    ("_validate_due_date_format", "invalid", "Invalid due_date format"),
+    ("_validate_due_date_format", "tomorrow", "Invalid due_date format"),
+    ("_validate_color", "invalid_color", "Invalid color"),
+    ("_validate_view_style", "list", None),
+    ("_validate_view_style", "board", None),
+    ("_validate_view_style", None, None),
+    ("_validate_view_style", "kanban", "Invalid view_style"),
+]
+
+
+def _validator_case_id(method, arg, error):
+    """Readable id for -k selection, e.g. priority-str-5-invalid"""
+    value = "none" if arg is None else f"{type(arg).__name__}-{arg}"
+    outcome = "invalid" if error else "valid"
+    return f"{method.removeprefix('_validate_')}-{value}-{outcome}"
+
+
+VALIDATOR_IDS = [_validator_case_id(*case) for case in VALIDATOR_CASES]
+
+
+class TestInitialization:
+    """TodoistService construction and API token handling"""
+
+    def test_init_with_token(self, todoist_api_class):
         """Test service initialization with API token"""
-        with patch("services.todoist.TodoistAPI") as mock_api:
-            service = TodoistService(api_token="test_token")
-            assert service.api_token == "test_token"
-            mock_api.assert_called_once_with("test_token")
+        # Forget the session fixture's own construction of the client
+        todoist_api_class.reset_mock()
+        service = TodoistService(api_token="test_token")
+        assert service.api_token == "test_token"
+        todoist_api_class.assert_called_once_with("test_token")
 
-    def test_init_with_env_token(self):
+    def test_init_with_env_token(self, todoist_api_class, monkeypatch):
         """Test service initialization with environment variable"""
-        with patch.dict("os.environ", {"TODOIST_API_TOKEN": "env_token"}):
-            with patch("services.todoist.TodoistAPI") as mock_api:
-                service = TodoistService()
-                assert service.api_token == "env_token"
-                mock_api.assert_called_once_with("env_token")
+        monkeypatch.setenv("TODOIST_API_TOKEN", "env_token")
+        todoist_api_class.reset_mock()
+        service = TodoistService()
+        assert service.api_token == "env_token"
+        todoist_api_class.assert_called_once_with("env_token")
 
-    def test_init_without_token_raises_error(self):
+    def test_init_without_token_raises_error(self, monkeypatch):
         """Test that initialization without token raises ValueError"""
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(ValueError, match="Todoist API token is required"):
-                TodoistService()
+        monkeypatch.delenv("TODOIST_API_TOKEN", raising=False)
+        with pytest.raises(ValueError, match="Todoist API token is required"):
+            TodoistService()
 
-    # ========== VALIDATION TESTS ==========
+
+class TestValidation:
+    """Input validation helpers"""
 
     @pytest.mark.parametrize(
         "priority,expected",
         [("1", 1), ("2", 2), ("3", 3), ("4", 4), (1, 1), (4, 4), (None, None)],
+        ids=["str-1", "str-2", "str-3", "str-4", "int-1", "int-4", "none"],
     )
     def test_validate_priority_valid(self, todoist_service, priority, expected):
         """Test priority validation with valid values"""
         result = todoist_service._validate_priority(priority)
         assert result == expected
 
-    @pytest.mark.parametrize("priority", ["5", "0", "-1", "invalid", 5, 0])
-    def test_validate_priority_invalid(self, todoist_service, priority):
-        """Test priority validation with invalid values"""
-        with pytest.raises(ValueError, match="Invalid priority"):
-            todoist_service._validate_priority(priority)
-
-    @pytest.mark.parametrize("duration_unit", ["minute", "day", None])
-    def test_validate_duration_unit_valid(self, todoist_service, duration_unit):
-        """Test duration unit validation with valid values"""
-        todoist_service._validate_duration_unit(duration_unit)  # Should not raise
-
-    @pytest.mark.parametrize("duration_unit", ["hour", "week", "invalid"])
-    def test_validate_duration_unit_invalid(self, todoist_service, duration_unit):
-        """Test duration unit validation with invalid values"""
-        with pytest.raises(ValueError, match="Invalid duration_unit"):
-            todoist_service._validate_duration_unit(duration_unit)
+    @pytest.mark.parametrize("method,arg,error", VALIDATOR_CASES, ids=VALIDATOR_IDS)
+    def test_validator(self, todoist_service, method, arg, error):
+        """Test simple validators accept valid values and reject invalid ones"""
+        validate = getattr(todoist_service, method)
+        if error is None:
+            validate(arg)  # Should not raise
+        else:
+            with pytest.raises(ValueError, match=error):
+                validate(arg)
 
     def test_validate_project_id_valid(self, todoist_service, mock_todoist_api):
         """Test project ID validation with existing project"""
@@ -80,8 +136,6 @@ class TestTodoistService:
 
     def test_validate_section_id_valid(self, todoist_service, mock_todoist_api):
         """Test section ID validation with existing section"""
-        from tests.conftest import MockTodoistSection
-
         mock_todoist_api.get_section.return_value = MockTodoistSection(id="sec123")
         todoist_service._validate_section_id("sec123")  # Should not raise
         mock_todoist_api.get_section.assert_called_once_with("sec123")
@@ -95,40 +149,14 @@ class TestTodoistService:
         with pytest.raises(ValueError, match="Invalid label"):
             todoist_service._validate_label_names(["nonexistent"])
 
-    @pytest.mark.parametrize("date_str", ["2024-12-31", "2024-01-01", "2025-06-15"])
-    def test_validate_due_date_format_valid(self, todoist_service, date_str):
-        """Test due date format validation with valid dates"""
-        todoist_service._validate_due_date_format(date_str)  # Should not raise
-
-    @pytest.mark.parametrize(
-        "date_str", ["12/31/2024", "2024-13-01", "invalid", "tomorrow"]
-    )
-    def test_validate_due_date_format_invalid(self, todoist_service, date_str):
-        """Test due date format validation with invalid dates"""
-        with pytest.raises(ValueError, match="Invalid due_date format"):
-            todoist_service._validate_due_date_format(date_str)
-
-    def test_validate_color_valid(self, todoist_service, test_colors):
+    @pytest.mark.parametrize("color", TEST_COLORS)
+    def test_validate_color_valid(self, todoist_service, color):
         """Test color validation with valid colors"""
-        for color in test_colors:
-            todoist_service._validate_color(color)  # Should not raise
-
-    def test_validate_color_invalid(self, todoist_service):
-        """Test color validation with invalid color"""
-        with pytest.raises(ValueError, match="Invalid color"):
-            todoist_service._validate_color("invalid_color")
-
-    @pytest.mark.parametrize("view_style", ["list", "board", None])
-    def test_validate_view_style_valid(self, todoist_service, view_style):
-        """Test view style validation with valid values"""
-        todoist_service._validate_view_style(view_style)  # Should not raise
+        todoist_service._validate_color(color)  # Should not raise
 
-    def test_validate_view_style_invalid(self, todoist_service):
-        """Test view style validation with invalid value"""
-        with pytest.raises(ValueError, match="Invalid view_style"):
-            todoist_service._validate_view_style("kanban")
 
-    # ========== TASK OPERATION TESTS ==========
+class TestTaskOperations:
+    """Task CRUD operations"""
 
     def test_get_tasks(self, todoist_service, mock_todoist_api):
         """Test getting tasks"""
@@ -140,18 +168,16 @@ class TestTodoistService:
     def test_get_tasks_with_filters(self, todoist_service, mock_todoist_api):
         """Test getting tasks with filters"""
         todoist_service.get_tasks(project_id="proj123", label="urgent")
-        mock_todoist_api.get_tasks.assert_called_once_with(
+        get_tasks = mock_todoist_api.get_tasks
+        assert get_tasks.call_count == 1
+        assert get_tasks.call_args == call(
             project_id="proj123", section_id=None, label="urgent", ids=None
         )
 
     def test_get_tasks_with_pagination(self, todoist_service, mock_todoist_api):
         """Test getting tasks with pagination"""
-        # Mock API returning 10 tasks
-        mock_tasks = [
-            MockTodoistTask(id=str(i), content=f"Task {i}", priority=1)
-            for i in range(10)
-        ]
-        mock_todoist_api.get_tasks.return_value = iter([mock_tasks])
+        # Mock API returning 10 tasks, with a fresh page iterator on every call
+        mock_todoist_api.get_tasks.side_effect = lambda *a, **kw: paged(_TEN_TASKS)
 
         # Get first 3 tasks
         tasks = todoist_service.get_tasks(limit=3, offset=0)
@@ -161,7 +187,6 @@ class TestTodoistService:
         assert tasks[2]["id"] == "2"
 
         # Get next 3 tasks
-        mock_todoist_api.get_tasks.return_value = iter([mock_tasks])
         tasks = todoist_service.get_tasks(limit=3, offset=3)
         assert len(tasks) == 3
         assert tasks[0]["id"] == "3"
@@ -169,7 +194,6 @@ class TestTodoistService:
         assert tasks[2]["id"] == "5"
 
         # Get tasks with offset only
-        mock_todoist_api.get_tasks.return_value = iter([mock_tasks])
         tasks = todoist_service.get_tasks(offset=7)
         assert len(tasks) == 3
         assert tasks[0]["id"] == "7"
@@ -206,11 +230,10 @@ class TestTodoistService:
         )
 
         assert task["content"] == "New Task"
-        call_args = mock_todoist_api.add_task.call_args
-        assert call_args.kwargs["priority"] == 3
+        mock_todoist_api.add_task.assert_called_once()
+        kwargs = mock_todoist_api.add_task.call_args.kwargs
         # due_date is now converted to a date object
-
-        assert call_args.kwargs["due_date"] == date(2024, 12, 31)
+        assert kwargs.items() >= {"priority": 3, "due_date": date(2024, 12, 31)}.items()
 
     def test_create_task_for_mcp_type_conversion(
         self, todoist_service, mock_todoist_api
@@ -223,10 +246,10 @@ class TestTodoistService:
             order="5",  # String instead of int
         )
 
-        call_args = mock_todoist_api.add_task.call_args
-        assert call_args.kwargs["priority"] == 4  # Converted to int
-        assert call_args.kwargs["duration"] == 60  # Converted to int
-        assert call_args.kwargs["order"] == 5  # Converted to int
+        mock_todoist_api.add_task.assert_called_once()
+        kwargs = mock_todoist_api.add_task.call_args.kwargs
+        # String arguments are converted to int
+        assert kwargs.items() >= {"priority": 4, "duration": 60, "order": 5}.items()
 
     def test_update_task(self, todoist_service, mock_todoist_api):
         """Test updating a task"""
@@ -236,9 +259,8 @@ class TestTodoistService:
 
         assert task["content"] == "Updated Task"
         mock_todoist_api.update_task.assert_called_once()
-        call_args = mock_todoist_api.update_task.call_args
-        assert call_args.kwargs["task_id"] == "123"
-        assert call_args.kwargs["priority"] == 2
+        kwargs = mock_todoist_api.update_task.call_args.kwargs
+        assert kwargs.items() >= {"task_id": "123", "priority": 2}.items()
 
     def test_close_task(self, todoist_service, mock_todoist_api):
         """Test completing a task"""
@@ -258,7 +280,9 @@ class TestTodoistService:
         assert result is True
         mock_todoist_api.delete_task.assert_called_once_with("123")
 
-    # ========== PROJECT OPERATION TESTS ==========
+
+class TestProjectOperations:
+    """Project operations"""
 
     def test_get_projects(self, todoist_service, mock_todoist_api):
         """Test getting all projects"""
@@ -305,7 +329,9 @@ class TestTodoistService:
         assert result is True
         mock_todoist_api.delete_project.assert_called_once_with("1")
 
-    # ========== LABEL OPERATION TESTS ==========
+
+class TestLabelOperations:
+    """Label operations"""
 
     def test_get_labels(self, todoist_service, mock_todoist_api):
         """Test getting all labels"""
@@ -325,7 +351,9 @@ class TestTodoistService:
         assert label["name"] == "important"
         mock_todoist_api.add_label.assert_called_once()
 
-    # ========== RESOURCE METHOD TESTS ==========
+
+class TestResourceMethods:
+    """MCP resource methods"""
 
     def test_get_today_tasks_resource(
         self, todoist_service, mock_todoist_api, test_dates
@@ -334,21 +362,20 @@ class TestTodoistService:
         today_task = MockTodoistTask(
             id="1", content="Today Task", due=MockTodoistDue(date=test_dates["today"])
         )
-        mock_todoist_api.get_tasks.return_value = iter(
+        set_tasks(
+            mock_todoist_api,
             [
-                [
-                    today_task,
-                    MockTodoistTask(
-                        id="2",
-                        content="Tomorrow Task",
-                        due=MockTodoistDue(date=test_dates["tomorrow"]),
-                    ),
-                    MockTodoistTask(id="3", content="No Due Date"),
-                ]
-            ]
+                today_task,
+                MockTodoistTask(
+                    id="2",
+                    content="Tomorrow Task",
+                    due=MockTodoistDue(date=test_dates["tomorrow"]),
+                ),
+                _NO_DUE_TASK,
+            ],
         )
         # Mock filter_tasks to return only today's task
-        mock_todoist_api.filter_tasks.return_value = iter([[today_task]])
+        mock_todoist_api.filter_tasks.return_value = paged([today_task])
 
         result = todoist_service.get_today_tasks_resource()
         assert result["tasks_count"] == 1
@@ -365,20 +392,19 @@ class TestTodoistService:
             content="Overdue Task",
             due=MockTodoistDue(date=test_dates["yesterday"]),
         )
-        mock_todoist_api.get_tasks.return_value = iter(
+        set_tasks(
+            mock_todoist_api,
             [
-                [
-                    overdue_task,
-                    MockTodoistTask(
-                        id="2",
-                        content="Today Task",
-                        due=MockTodoistDue(date=test_dates["today"]),
-                    ),
-                ]
-            ]
+                overdue_task,
+                MockTodoistTask(
+                    id="2",
+                    content="Today Task",
+                    due=MockTodoistDue(date=test_dates["today"]),
+                ),
+            ],
         )
         # Mock filter_tasks to return only overdue task
-        mock_todoist_api.filter_tasks.return_value = iter([[overdue_task]])
+        mock_todoist_api.filter_tasks.return_value = paged([overdue_task])
 
         result = todoist_service.get_overdue_tasks_resource()
         assert result["tasks_count"] == 1
@@ -386,23 +412,23 @@ class TestTodoistService:
         assert "timezone" in result
         assert "date" in result
 
-    def test_get_priorities_resource(self, todoist_service):
+    def test_get_priorities_resource(self, priorities_resource):
         """Test getting priority information"""
-        priorities = todoist_service.get_priorities_resource()
+        priorities = priorities_resource
         assert "priorities" in priorities
         assert len(priorities["priorities"]) == 4
         assert priorities["default"] == 1
 
-    def test_get_colors_resource(self, todoist_service):
+    def test_get_colors_resource(self, colors_resource):
         """Test getting color information"""
-        colors = todoist_service.get_colors_resource()
+        colors = colors_resource
         assert "colors" in colors
         assert len(colors["colors"]) == 20
         assert colors["colors"][0]["name"] == "berry_red"
 
-    def test_get_common_filters_resource(self, todoist_service):
+    def test_get_common_filters_resource(self, common_filters_resource):
         """Test getting common filter strings"""
-        filters = todoist_service.get_common_filters_resource()
+        filters = common_filters_resource
         assert "filters" in filters
         assert len(filters["filters"]) > 0
         assert any(f["filter"] == "today" for f in filters["filters"])
@@ -411,20 +437,15 @@ class TestTodoistService:
         self, todoist_service, mock_todoist_api, test_dates
     ):
         """Test getting task statistics"""
-        mock_todoist_api.get_tasks.return_value = iter(
+        set_tasks(
+            mock_todoist_api,
             [
-                [
-                    MockTodoistTask(id="1", priority=4),
-                    MockTodoistTask(id="2", priority=3),
-                    MockTodoistTask(id="3", priority=1),
-                    MockTodoistTask(
-                        id="4", due=MockTodoistDue(date=test_dates["yesterday"])
-                    ),
-                    MockTodoistTask(
-                        id="5", due=MockTodoistDue(date=test_dates["today"])
-                    ),
-                ]
-            ]
+                *_STATS_PRIORITY_TASKS,
+                MockTodoistTask(
+                    id="4", due=MockTodoistDue(date=test_dates["yesterday"])
+                ),
+                MockTodoistTask(id="5", due=MockTodoistDue(date=test_dates["today"])),
+            ],
         )
 
         stats = todoist_service.get_task_stats_resource()
@@ -434,51 +455,74 @@ class TestTodoistService:
         assert stats["by_due"]["overdue"] == 1
         assert stats["by_due"]["today"] == 1
 
-    # ========== ERROR HANDLING TESTS ==========
-
-    def test_create_task_auth_error(self, todoist_service, mock_todoist_api):
-        """Test authentication error handling"""
-        mock_todoist_api.add_task.side_effect = Exception("401 Unauthorized")
 
-        with pytest.raises(ValueError, match="Authentication failed"):
-            todoist_service.create_task(content="Test")
+class TestErrorHandling:
+    """API error translation"""
 
-    def test_create_task_not_found_error(self, todoist_service, mock_todoist_api):
-        """Test resource not found error handling"""
-        mock_todoist_api.add_task.side_effect = Exception("404 Not Found")
-
-        with pytest.raises(ValueError, match="Resource not found"):
-            todoist_service.create_task(content="Test")
+    @pytest.mark.parametrize(
+        "api_method,error,method,kwargs,match",
+        [
+            (
+                "add_task",
+                _AUTH_ERR,
+                "create_task",
+                {"content": "Test"},
+                "Authentication failed",
+            ),
+            (
+                "add_task",
+                _NOT_FOUND_ERR,
+                "create_task",
+                {"content": "Test"},
+                "Resource not found",
+            ),
+            (
+                "update_task",
+                _NOT_FOUND_ERR,
+                "update_task",
+                {"task_id": "nonexistent", "content": "Test"},
+                "Task with ID .* not found",
+            ),
+        ],
+        ids=["create-auth", "create-not-found", "update-not-found"],
+    )
+    def test_api_error_translation(
+        self,
+        todoist_service,
+        mock_todoist_api,
+        api_method,
+        error,
+        method,
+        kwargs,
+        match,
+    ):
+        """Test that API errors surface as descriptive ValueErrors"""
+        getattr(mock_todoist_api, api_method).side_effect = error
 
-    def test_update_task_not_found(self, todoist_service, mock_todoist_api):
-        """Test updating non-existent task"""
-        mock_todoist_api.update_task.side_effect = Exception("404 Not Found")
+        with pytest.raises(ValueError, match=match):
+            getattr(todoist_service, method)(**kwargs)
 
-        with pytest.raises(ValueError, match="Task with ID .* not found"):
-            todoist_service.update_task(task_id="nonexistent", content="Test")
 
-    # ========== MCP WRAPPER TESTS ==========
+class TestMCPWrappers:
+    """MCP tool wrappers"""
 
-    def test_close_task_for_mcp(self, todoist_service, mock_todoist_api):
-        """Test MCP wrapper for closing task"""
-        result = todoist_service.close_task_for_mcp("123")
-        assert result["success"] is True
-        assert "completed" in result["message"]
-        mock_todoist_api.complete_task.assert_called_once_with(task_id="123")
-
-    def test_reopen_task_for_mcp(self, todoist_service, mock_todoist_api):
-        """Test MCP wrapper for reopening task"""
-        result = todoist_service.reopen_task_for_mcp("123")
-        assert result["success"] is True
-        assert "reopened" in result["message"]
-        mock_todoist_api.uncomplete_task.assert_called_once_with(task_id="123")
-
-    def test_delete_task_for_mcp(self, todoist_service, mock_todoist_api):
-        """Test MCP wrapper for deleting task"""
-        result = todoist_service.delete_task_for_mcp("123")
+    @pytest.mark.parametrize(
+        "method,api_method,word,expected_call",
+        [
+            ("close_task_for_mcp", "complete_task", "completed", call(task_id="123")),
+            ("reopen_task_for_mcp", "uncomplete_task", "reopened", call(task_id="123")),
+            ("delete_task_for_mcp", "delete_task", "deleted", call("123")),
+        ],
+        ids=["close", "reopen", "delete"],
+    )
+    def test_task_lifecycle_for_mcp(
+        self, todoist_service, mock_todoist_api, method, api_method, word, expected_call
+    ):
+        """Test MCP wrappers for closing, reopening and deleting a task"""
+        result = getattr(todoist_service, method)("123")
         assert result["success"] is True
-        assert "deleted" in result["message"]
-        mock_todoist_api.delete_task.assert_called_once_with("123")
+        assert word in result["message"]
+        assert getattr(mock_todoist_api, api_method).call_args_list == [expected_call]
 
     def test_get_projects_for_mcp(self, todoist_service):
         """Test MCP wrapper for getting projects"""